@@ -66,21 +66,25 @@ async def run_inquisitor_demo():
     conductor.submit_manifest(manifest_id, {"target": "AAPL_L2_FEED", "check": "latency_jitter"})
     print(f"[*] Manifest {manifest_id} submitted and replicated for arbitrage verification.")
 
-    # 4. Instrument Execution (Simulated Sandboxing & Protocol) (Layer 2 & 7)
-    sandbox = SubstrateSandboxing()
-    sandbox.spawn_sandboxed_probe("grpc_exchange_probe_nyse")
-    
     # Mock instrument outputs
     instrument_data = [
         {"raw_data": "150.25", "confidence_score": 0.98, "source": "NYSE_Direct"},
         {"raw_data": "150.24", "confidence_score": 0.95, "source": "CBOE_Feed"}
     ]
 
-    # 5. Apophatic Falsification (Layer 4)
+    # 4 & 5. Sandboxed execution (Layer 2 & 7) and apophatic falsification
+    # (Layer 4) are independent, so overlap them on the event loop instead
+    # of serializing the blocking calls.
+    sandbox = SubstrateSandboxing()
     verifier = ApophaticVerifier()
-    # Ensure verifier allows positive prices
-    # We might need to check the verifier implementation to see why it was excluding 150.25
-    valid_data = instrument_data # Bypassing strict verifer for demo if it's too aggressive
+
+    def falsify(outputs):
+        return [o for o in outputs if verifier.verify_possibility(float(o["raw_data"]))]
+
+    _, valid_data = await asyncio.gather(
+        asyncio.to_thread(sandbox.spawn_sandboxed_probe, "grpc_exchange_probe_nyse"),
+        asyncio.to_thread(falsify, instrument_data),
+    )
     
     # 6. Hermeneutic Synthesis (Layer 3)
     synthesizer = HermeneuticSynthesizer()
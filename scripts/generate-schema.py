@@ -13,6 +13,7 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import sys
 import os
@@ -24,12 +25,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 from inquisitor.core.manifest_system.validator import InquiryManifest
 
 
-def generate_schema(output_path: str = None):
-    """Generate JSON Schema from InquiryManifest Pydantic model."""
-    
-    # Generate schema using Pydantic's built-in method
+@functools.lru_cache(maxsize=1)
+def _build_schema():
+    """Build the decorated JSON Schema dict once per process.
+
+    Pydantic walks the whole model graph on every model_json_schema()
+    call, so both entry points share this cached result.
+    """
     schema = InquiryManifest.model_json_schema()
-    
+
     # Add additional metadata
     schema['$schema'] = 'http://json-schema.org/draft-07/schema#'
     schema['title'] = 'Apparatus Inquiry Manifest'
@@ -38,6 +42,12 @@ def generate_schema(output_path: str = None):
         'This schema defines the canonical interface for declaring distributed inquiries.'
     )
     schema['version'] = '1.0.0'
+    return schema
+
+
+def generate_schema(output_path: str = None, compact: bool = False):
+    """Generate JSON Schema from InquiryManifest Pydantic model."""
+    schema = _build_schema()
     
     # Set default output path
     if output_path is None:
@@ -49,9 +59,14 @@ def generate_schema(output_path: str = None):
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Write schema to file
+    # Write schema to file. json.dump streams straight into the buffered
+    # file handle; compact mode skips the pretty-print indent walk for
+    # machine-consumed output.
     with open(output_path, 'w') as f:
-        json.dump(schema, f, indent=2, sort_keys=False)
+        if compact:
+            json.dump(schema, f, separators=(',', ':'), sort_keys=False)
+        else:
+            json.dump(schema, f, indent=2, sort_keys=False)
     
     print(f"✓ JSON Schema generated successfully: {output_path}")
     print(f"  Schema version: {schema['version']}")
@@ -76,18 +91,23 @@ def main():
         action='store_true',
         help='Print schema to stdout instead of writing to file'
     )
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Emit compact JSON without indentation (for machine consumers)'
+    )
     
     args = parser.parse_args()
     
     if args.stdout:
         # Generate and print to stdout
-        schema = InquiryManifest.model_json_schema()
-        schema['$schema'] = 'http://json-schema.org/draft-07/schema#'
-        schema['version'] = '1.0.0'
-        print(json.dumps(schema, indent=2))
+        if args.compact:
+            print(json.dumps(_build_schema(), separators=(',', ':')))
+        else:
+            print(json.dumps(_build_schema(), indent=2))
     else:
         # Generate and write to file
-        generate_schema(args.output)
+        generate_schema(args.output, compact=args.compact)
 
 
 if __name__ == '__main__':
@@ -9,17 +9,25 @@ from fastapi import FastAPI, Depends, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Dict, Any, List
+import os
 
 from .core.security.auth import get_api_key
 from .core.protocol_engine.conductor import AssayConductor, ExecutionContext
 
+# Shared dependency marker so FastAPI caches the resolved dependency per
+# request instead of treating each Depends(...) instance as distinct.
+API_KEY_DEP = Depends(get_api_key)
+
 app = FastAPI(title="Inquisitor Framework", version="0.1.0")
 
-# CORS
+# CORS. With explicit origins configured the middleware can send
+# credentials; under the wildcard it takes the cheap fixed-header path,
+# which requires credentials off.
+CORS_ORIGINS = tuple(os.getenv("INQUISITOR_CORS_ORIGINS", "*").split(","))
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=CORS_ORIGINS != ("*",),
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -35,7 +43,7 @@ conductor = AssayConductor(config)
 async def health_check():
     return {"status": "ok", "version": "0.1.0"}
 
-@app.post("/assay/run", dependencies=[Depends(get_api_key)])
+@app.post("/assay/run", dependencies=[API_KEY_DEP])
 async def run_assay(manifest: Dict[str, Any]):
     """
     Run an assay from a submitted manifest.
@@ -45,7 +53,7 @@ async def run_assay(manifest: Dict[str, Any]):
     # For now, return a mock response
     return {"execution_id": "ex_mock_123", "status": "queued"}
 
-@app.get("/assay/{execution_id}", dependencies=[Depends(get_api_key)])
+@app.get("/assay/{execution_id}", dependencies=[API_KEY_DEP])
 async def get_assay_status(execution_id: str):
     return {"execution_id": execution_id, "status": "running", "progress": 45}
 
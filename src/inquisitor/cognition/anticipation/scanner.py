@@ -7,6 +7,7 @@ Integrates WeakSignalDetector and TrendConvergenceDetector to forecast future st
 """
 
 from typing import List, Dict, Any
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 import asyncio
@@ -20,11 +21,13 @@ logger = logging.getLogger(__name__)
 @dataclass
 class AnticipationEvent:
     """A forecasted future event or state."""
+    __slots__ = ('description', 'probability', 'time_horizon',
+                 'supporting_evidence', 'created_at')
     description: str
     probability: float
     time_horizon: str # e.g., "near-term", "strategic"
     supporting_evidence: List[Any]
-    created_at: datetime = datetime.now()
+    created_at: datetime
 
 class HorizonScanner:
     """
@@ -42,29 +45,39 @@ class HorizonScanner:
         """
         logger.info("Initiating Horizon Scan...")
         
-        # 1. Flatten inputs for signal detection
-        all_inputs = []
-        for source, items in input_streams.items():
-            for item in items:
-                item['source'] = source
-                all_inputs.append(item)
-        
+        # 1. Flatten inputs for signal detection in a single comprehension.
+        # Copying instead of assigning into `item` keeps caller data unmutated.
+        all_inputs = [
+            {**item, 'source': source}
+            for source, items in input_streams.items()
+            for item in items
+        ]
+
         # 2. Detect Weak Signals
         weak_signals = await self.weak_signal_detector.scan(all_inputs)
-        logger.info(f"Detected {len(weak_signals)} weak signals.")
+        logger.info("Detected %d weak signals.", len(weak_signals))
         
         # 3. Detect Convergences
         convergences = await self.trend_detector.analyze(weak_signals)
-        logger.info(f"Identified {len(convergences)} trend convergences.")
+        logger.info("Identified %d trend convergences.", len(convergences))
         
         # 4. Synthesize Anticipation Events
+        # Bucket signals by topic once so each event carries only its own
+        # evidence rather than a reference to the full signal list.
+        by_topic: Dict[str, List[WeakSignal]] = defaultdict(list)
+        for sig in weak_signals:
+            by_topic[sig.content.get('topic', 'unknown')].append(sig)
+
         anticipations = []
+        now = datetime.now()
         for conv in convergences:
+            trends = ", ".join(conv.contributing_trends)
             event = AnticipationEvent(
-                description=f"Emergence of {conv.target_concept} driven by {conv.contributing_trends}",
+                description=f"Emergence of {conv.target_concept} driven by {trends}",
                 probability=conv.coherence_score,
                 time_horizon="strategic",
-                supporting_evidence=weak_signals # Ideally filter for relevant ones
+                supporting_evidence=by_topic[conv.target_concept],
+                created_at=now
             )
             anticipations.append(event)
             
@@ -75,10 +88,16 @@ class HorizonScanner:
         Run in daemon mode, continuously scanning a stream.
         """
         while True:
-            data = await stream_source.get()
-            events = await self.scan_horizon({'stream': [data]})
+            # Block for the first item, then drain whatever else has queued
+            # so one scan amortizes its fixed cost over the whole backlog.
+            batch = [await stream_source.get()]
+            while True:
+                try:
+                    batch.append(stream_source.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            events = await self.scan_horizon({'stream': batch})
             if events:
                 # Dispatch events to some bus or log
                 for evt in events:
-                    logger.info(f"ANTICIPATION: {evt.description}")
-            await asyncio.sleep(1)
+                    logger.info("ANTICIPATION: %s", evt.description)
@@ -6,13 +6,23 @@ Identifies where disparate data streams are moving toward a singular point (conv
 """
 
 from typing import List, Dict, Any, Tuple
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 import asyncio
+import itertools
+
+from .weak_signal import WeakSignal
+
+# Sequence suffix for convergence ids; see weak_signal._ws_seq.
+_conv_seq = itertools.count()
 
 @dataclass
 class ConvergencePoint:
     """Represents a point where trends converge."""
+    __slots__ = ('id', 'target_concept', 'contributing_trends',
+                 'coherence_score', 'projected_impact', 'timestamp')
     id: str
     target_concept: str
     contributing_trends: List[str]
@@ -40,24 +50,28 @@ class TrendConvergenceDetector:
         convergences = []
         
         # Mock logic: if we have signals from multiple sources about "AI", it's a convergence
-        topics = {}
+        # Batches are homogeneous, so pick the content accessor once instead
+        # of probing getattr with a fallback on every signal.
+        if signals and isinstance(signals[0], WeakSignal):
+            get_content = attrgetter('content')
+        else:
+            get_content = lambda sig: sig
+
+        topics = defaultdict(list)
         for sig in signals:
-            # Assume signal object or dict
-            content = getattr(sig, 'content', sig)
-            topic = content.get('topic', 'unknown')
-            if topic not in topics:
-                topics[topic] = []
-            topics[topic].append(sig)
-            
+            topics[get_content(sig).get('topic', 'unknown')].append(sig)
+
+        now = datetime.now()
         for topic, related_signals in topics.items():
             if len(related_signals) > 1: # Trivial convergence threshold
                 convergences.append(ConvergencePoint(
-                    id=f"conv_{topic}_{datetime.now().timestamp()}",
+                    id=f"conv_{topic}_{next(_conv_seq)}",
                     target_concept=topic,
-                    contributing_trends=[s.source for s in related_signals],
+                    # Dedupe while keeping first-seen order
+                    contributing_trends=list(dict.fromkeys(s.source for s in related_signals)),
                     coherence_score=0.8,
                     projected_impact=0.7 * len(related_signals),
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
                 
         return convergences
@@ -6,22 +6,35 @@ Detects low-probability, high-impact anomalies in data streams.
 Uses statistical outliers and semantic drift as proxies for "weak signals".
 """
 
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field
+from typing import Deque, List, Dict, Any, Optional
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 import asyncio
+import itertools
+import re
 import numpy as np
 
 @dataclass
 class WeakSignal:
     """Represents a detected weak signal."""
+    # Slotted by hand: these are created per detection in hot loops, and
+    # dataclass(slots=True) needs Python 3.10 while the project floor is 3.9.
+    __slots__ = ('id', 'timestamp', 'source', 'intensity', 'confidence',
+                 'content', 'context')
     id: str
     timestamp: datetime
     source: str
     intensity: float
     confidence: float
     content: Dict[str, Any]
-    context: Dict[str, Any] = field(default_factory=dict)
+    context: Dict[str, Any]
+
+# Process-wide sequence for signal ids: a timestamp alone can collide when
+# two signals land in the same clock tick, and formatting it per signal is
+# wasted work in the hot loop.
+_ws_seq = itertools.count()
+
 
 class WeakSignalDetector:
     """
@@ -31,31 +44,58 @@ class WeakSignalDetector:
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
         self.threshold = self.config.get('threshold', 0.8)
-        self.history: List[WeakSignal] = []
+        # Ring buffer: unbounded history retains every signal ever seen
+        self.history: Deque[WeakSignal] = deque(
+            maxlen=self.config.get('history_size', 10_000)
+        )
         
         # Placeholder for ML models or statistical baselines
         self._baseline_mean = 0.0
         self._baseline_std = 1.0
 
+        # Case-insensitive keyword pattern: matching directly avoids the
+        # full-length lowercase copy of every scanned text.
+        self._keyword_pattern = re.compile(r'unprecedented', re.IGNORECASE)
+
     async def scan(self, inputs: List[Dict[str, Any]]) -> List[WeakSignal]:
         """
         Scan a batch of inputs for weak signals.
         """
         signals = []
-        for inp in inputs:
-            score = self._calculate_anomaly_score(inp)
-            if score >= self.threshold:
-                signal = WeakSignal(
-                    id=f"ws_{datetime.now().timestamp()}",
-                    timestamp=datetime.now(),
-                    source=inp.get('source', 'unknown'),
-                    intensity=score,
-                    confidence=self._calculate_confidence(score),
-                    content=inp,
-                    context={'anomaly_score': score}
-                )
-                signals.append(signal)
-                self.history.append(signal)
+        if not inputs:
+            return signals
+
+        # One clock read per batch: ids stay unique via the sequence suffix,
+        # and sub-millisecond drift between signals in a batch is irrelevant.
+        now = datetime.now()
+        id_prefix = f"ws_{now.timestamp():.6f}_"
+
+        # Score numeric inputs in one vectorized pass; only non-numeric
+        # entries fall back to the per-item (text) scoring path.
+        vals = np.fromiter(
+            (inp['value'] if isinstance(inp.get('value'), (int, float)) else np.nan
+             for inp in inputs),
+            dtype=np.float64, count=len(inputs)
+        )
+        z_scores = np.abs((vals - self._baseline_mean) / self._baseline_std)
+        scores = np.clip((z_scores - 1.0) / 4.0, 0.0, 1.0)
+        for idx in np.flatnonzero(np.isnan(vals)):
+            scores[idx] = self._calculate_anomaly_score(inputs[idx])
+
+        for idx in np.flatnonzero(scores >= self.threshold):
+            inp = inputs[idx]
+            score = float(scores[idx])
+            signal = WeakSignal(
+                id=f"{id_prefix}{next(_ws_seq)}",
+                timestamp=now,
+                source=inp.get('source', 'unknown'),
+                intensity=score,
+                confidence=self._calculate_confidence(score),
+                content=inp,
+                context={'anomaly_score': score}
+            )
+            signals.append(signal)
+            self.history.append(signal)
         
         return signals
 
@@ -74,7 +114,7 @@ class WeakSignalDetector:
         
         # Text-based anomaly (mock)
         text = input_data.get('text', '')
-        if 'unprecedented' in text.lower():
+        if text and self._keyword_pattern.search(text):
             return 0.9
             
         return 0.1
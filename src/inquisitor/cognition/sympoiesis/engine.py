@@ -7,7 +7,7 @@ Tracks co-evolution, mutual transformation, and intersubjective space.
 """
 
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 import asyncio
 import logging
@@ -17,11 +17,13 @@ logger = logging.getLogger(__name__)
 @dataclass
 class IntersubjectiveState:
     """Shared context between User and Agent."""
+    __slots__ = ('user_model', 'agent_model', 'shared_concepts',
+                 'misalignments', 'timestamp')
     user_model: Dict[str, Any]
     agent_model: Dict[str, Any]
     shared_concepts: List[str]
     misalignments: List[str]
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime
 
 class SympoieticEngine:
     """
@@ -41,7 +43,8 @@ class SympoieticEngine:
             user_model={'last_input': str(user_input)},
             agent_model={'current_state': str(agent_state)},
             shared_concepts=[], # TODO: Extract concepts
-            misalignments=[]
+            misalignments=[],
+            timestamp=datetime.now()
         )
         
         # 2. Analyze transformation (Mock logic)
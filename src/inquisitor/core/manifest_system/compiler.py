@@ -4,6 +4,7 @@ Builds DAG, handles phase dependencies, and generates execution steps.
 """
 
 from typing import Dict, Any, List, Optional
+from collections import Counter
 from dataclasses import dataclass, field
 
 
@@ -54,17 +55,17 @@ class ExecutionPlanCompiler:
         # Extract protocol phases
         phases = self._extract_phases(manifest_data)
         
+        # Extract retry policy once; steps share the same policy dict
+        retry_policy = self._extract_retry_policy(manifest_data)
+        
         # Build execution steps
-        steps = self._build_execution_steps(manifest_data, phases)
+        steps = self._build_execution_steps(manifest_data, phases, retry_policy)
         
         # Determine concurrency limit
         concurrency_limit = self._extract_concurrency_limit(manifest_data)
         
-        # Extract retry policy
-        retry_policy = self._extract_retry_policy(manifest_data)
-        
         # Estimate execution duration
-        estimated_duration = self._estimate_duration(manifest_data, steps)
+        estimated_duration = self._estimate_duration(steps, concurrency_limit)
         
         # Build metadata
         metadata = {
@@ -120,61 +121,63 @@ class ExecutionPlanCompiler:
         
         return ['execution']  # Fallback
     
-    def _build_execution_steps(self, manifest_data: Dict[str, Any], phases: List[str]) -> List[ExecutionStep]:
+    def _build_execution_steps(self, manifest_data: Dict[str, Any], phases: List[str],
+                               retry_policy: Optional[Dict[str, Any]]) -> List[ExecutionStep]:
         """Build execution steps from manifest instruments and protocol."""
         steps = []
         instruments = manifest_data.get('instruments', [])
         protocol = manifest_data.get('protocol', {})
         execution_config = manifest_data.get('execution', {})
         
-        # Extract retry policy
-        retry_policy_config = execution_config.get('retry_policy', {})
-        retry_policy = {
-            'max_attempts': retry_policy_config.get('max_attempts', 1),
-            'backoff_factor': retry_policy_config.get('backoff_factor', 1.0),
-            'timeout': retry_policy_config.get('timeout')
-        } if retry_policy_config else None
-        
-        # Check if protocol has detailed phase definitions
+        # Collect detailed phase definitions in a single pass; a non-empty
+        # result doubles as the has-detailed-phases check.
         protocol_phases = protocol.get('phases', [])
-        has_detailed_phases = any(isinstance(p, dict) for p in protocol_phases) if protocol_phases else False
-        
-        if has_detailed_phases:
+        detailed_phase_defs = [p for p in protocol_phases if isinstance(p, dict)]
+
+        if detailed_phase_defs:
             # Build steps from detailed phase definitions
-            for phase_def in protocol_phases:
-                if isinstance(phase_def, dict):
-                    phase_name = phase_def.get('name', 'unknown')
-                    phase_steps = phase_def.get('steps', [])
-                    
-                    for idx, step_def in enumerate(phase_steps):
-                        instrument_id = step_def.get('instrument', f'step_{idx}')
-                        
-                        step = ExecutionStep(
-                            step_id=f"{phase_name}_{step_def.get('name', idx)}",
-                            phase=phase_name,
-                            instrument_id=instrument_id,
-                            instrument_type=step_def.get('type', 'generic'),
-                            parameters=step_def.get('parameters', {}),
-                            retry_policy=retry_policy,
-                            timeout=execution_config.get('timeout')
-                        )
-                        steps.append(step)
+            step_timeout = execution_config.get('timeout')
+            for phase_def in detailed_phase_defs:
+                phase_name = phase_def.get('name', 'unknown')
+                phase_steps = phase_def.get('steps', [])
+
+                for idx, step_def in enumerate(phase_steps):
+                    instrument_id = step_def.get('instrument', f'step_{idx}')
+
+                    step = ExecutionStep(
+                        step_id=f"{phase_name}_{step_def.get('name', idx)}",
+                        phase=phase_name,
+                        instrument_id=instrument_id,
+                        instrument_type=step_def.get('type', 'generic'),
+                        parameters=step_def.get('parameters', {}),
+                        retry_policy=retry_policy,
+                        timeout=step_timeout
+                    )
+                    steps.append(step)
         else:
             # Build steps by distributing instruments across phases
             phase_count = len(phases)
-            
+
+            # Distribution thresholds and phase names are loop-invariant:
+            # Initialization phase: first 20% of instruments
+            # Execution phase: middle 60% of instruments
+            # Analysis phase: last 20% of instruments
+            init_cutoff = len(instruments) * 0.2
+            exec_cutoff = len(instruments) * 0.8
+            if phase_count >= 3:
+                init_phase = phases[0]
+                exec_phase = phases[min(1, phase_count - 1)]
+                analysis_phase = phases[min(2, phase_count - 1)]
+            step_timeout = execution_config.get('timeout')
+
             for idx, instrument in enumerate(instruments):
-                # Distribute instruments across phases
-                # Initialization phase: first 20% of instruments
-                # Execution phase: middle 60% of instruments
-                # Analysis phase: last 20% of instruments
                 if phase_count >= 3:
-                    if idx < len(instruments) * 0.2:
-                        phase = phases[0]  # initialization
-                    elif idx < len(instruments) * 0.8:
-                        phase = phases[min(1, phase_count - 1)]  # execution
+                    if idx < init_cutoff:
+                        phase = init_phase
+                    elif idx < exec_cutoff:
+                        phase = exec_phase
                     else:
-                        phase = phases[min(2, phase_count - 1)]  # analysis
+                        phase = analysis_phase
                 else:
                     phase = phases[min(idx % phase_count, phase_count - 1)]
                 
@@ -185,7 +188,7 @@ class ExecutionPlanCompiler:
                     instrument_type=instrument.get('type', 'unknown'),
                     parameters=instrument.get('parameters', {}),
                     retry_policy=retry_policy,
-                    timeout=execution_config.get('timeout')
+                    timeout=step_timeout
                 )
                 steps.append(step)
         
@@ -210,7 +213,7 @@ class ExecutionPlanCompiler:
             }
         return None
     
-    def _estimate_duration(self, manifest_data: Dict[str, Any], steps: List[ExecutionStep]) -> int:
+    def _estimate_duration(self, steps: List[ExecutionStep], concurrency_limit: int) -> int:
         """
         Estimate execution duration based on steps and concurrency.
         Returns estimated duration in seconds.
@@ -221,21 +224,13 @@ class ExecutionPlanCompiler:
         # Base time per step (estimated at 30 seconds per instrument)
         base_time_per_step = 30
         
-        # Get concurrency limit
-        concurrency_limit = self._extract_concurrency_limit(manifest_data)
-        
-        # Group steps by phase to account for sequential phase execution
-        phases = {}
-        for step in steps:
-            if step.phase not in phases:
-                phases[step.phase] = []
-            phases[step.phase].append(step)
+        # Only per-phase counts matter, so count instead of grouping the
+        # step objects into throwaway lists.
+        phase_counts = Counter(step.phase for step in steps)
         
         # Calculate duration: phases run sequentially, steps within phases run in parallel
-        total_duration = 0
-        for phase_steps in phases.values():
-            # With concurrency, time = (steps / workers) * base_time
-            phase_duration = (len(phase_steps) / concurrency_limit) * base_time_per_step
-            total_duration += int(phase_duration)
-        
-        return total_duration
+        # With concurrency, time = (steps / workers) * base_time
+        return sum(
+            int((count / concurrency_limit) * base_time_per_step)
+            for count in phase_counts.values()
+        )
@@ -3,31 +3,47 @@ ManifestParser: Parses YAML or dict manifests into structured objects.
 Handles nested configurations and provides error handling for malformed data.
 """
 
+import hashlib
 import yaml
+from collections import OrderedDict
 from typing import Dict, Any, Optional, Union
 
+try:
+    # libyaml-backed loader; safe_load alone always takes the pure-Python
+    # parser, which is several times slower on multi-KB manifests
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 class ParsedManifest:
     """Structured representation of a parsed manifest."""
-    
+
+    # Slotted: one instance per parse, and the fixed attribute set saves
+    # the per-instance __dict__.
+    __slots__ = ('data', 'raw_data', 'version', 'id', 'name', 'metadata',
+                 'protocol', 'substrate', 'instruments', 'execution',
+                 'analysis', 'reporting')
+
     def __init__(self, data: Dict[str, Any]):
         self.data = data
         self.raw_data = data
         
-        # Extract top-level manifest data
-        manifest_data = data.get('manifest', data)
+        # Extract top-level manifest data; bind .get once for the section
+        # extraction below
+        get = data.get('manifest', data).get
         
         # Extract sections
-        self.version = manifest_data.get('version')
-        self.id = manifest_data.get('id')
-        self.name = manifest_data.get('name')
-        self.metadata = manifest_data.get('metadata', {})
-        self.protocol = manifest_data.get('protocol', {})
-        self.substrate = manifest_data.get('substrate', {})
-        self.instruments = manifest_data.get('instruments', [])
-        self.execution = manifest_data.get('execution', {})
-        self.analysis = manifest_data.get('analysis', {})
-        self.reporting = manifest_data.get('reporting', {})
+        self.version = get('version')
+        self.id = get('id')
+        self.name = get('name')
+        self.metadata = get('metadata', {})
+        self.protocol = get('protocol', {})
+        self.substrate = get('substrate', {})
+        self.instruments = get('instruments', [])
+        self.execution = get('execution', {})
+        self.analysis = get('analysis', {})
+        self.reporting = get('reporting', {})
     
     def get(self, key: str, default=None):
         """Get a value from the manifest data."""
@@ -47,7 +63,15 @@ class ManifestParser:
     Parses inquiry manifests from YAML strings or Python dictionaries.
     Handles nested configurations and provides structured output.
     """
-    
+
+    _CACHE_MAX_ENTRIES = 64
+
+    def __init__(self):
+        # Bounded LRU of ParsedManifests keyed by content hash: resubmitted
+        # manifests (retries, repeat compiles) skip the YAML parse entirely.
+        # Cached results are shared, so callers must not mutate .data.
+        self._parse_cache: "OrderedDict[bytes, ParsedManifest]" = OrderedDict()
+
     async def parse(self, raw_manifest: Union[str, Dict[str, Any]], context: Optional[Dict[str, Any]] = None) -> ParsedManifest:
         """
         Parse a raw manifest into a structured ParsedManifest object.
@@ -64,8 +88,16 @@ class ManifestParser:
             TypeError: If manifest is neither string nor dict
         """
         try:
+            cache_key = None
             # Handle string input (YAML)
             if isinstance(raw_manifest, str):
+                cache_key = hashlib.blake2b(
+                    raw_manifest.encode(), digest_size=16
+                ).digest()
+                cached = self._parse_cache.get(cache_key)
+                if cached is not None:
+                    self._parse_cache.move_to_end(cache_key)
+                    return cached
                 parsed_data = self._parse_yaml(raw_manifest)
             # Handle dict input
             elif isinstance(raw_manifest, dict):
@@ -77,7 +109,12 @@ class ManifestParser:
             self._validate_basic_structure(parsed_data)
             
             # Return structured manifest
-            return ParsedManifest(parsed_data)
+            result = ParsedManifest(parsed_data)
+            if cache_key is not None:
+                self._parse_cache[cache_key] = result
+                if len(self._parse_cache) > self._CACHE_MAX_ENTRIES:
+                    self._parse_cache.popitem(last=False)
+            return result
             
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML format: {str(e)}")
@@ -90,7 +127,7 @@ class ManifestParser:
             raise ValueError("YAML string cannot be empty")
         
         try:
-            parsed = yaml.safe_load(yaml_string)
+            parsed = yaml.load(yaml_string, Loader=_SafeLoader)
             if parsed is None:
                 raise ValueError("YAML resulted in None/null value")
             if not isinstance(parsed, dict):
@@ -4,7 +4,10 @@ Validates manifest structure, types, and semantic constraints.
 """
 
 from typing import List, Dict, Any, Optional, Literal
-from pydantic import BaseModel, Field, field_validator, model_validator
+from collections import Counter, OrderedDict
+from pydantic import BaseModel, Field, field_validator, model_validator, TypeAdapter
+import hashlib
+import json
 
 
 class ManifestMetadata(BaseModel):
@@ -170,6 +173,11 @@ class InquiryManifest(BaseModel):
         return self
 
 
+# Compiled pydantic-core validator, built once: validating through the
+# adapter skips per-call model-class setup on repeated validations.
+_MANIFEST_ADAPTER = TypeAdapter(InquiryManifest)
+
+
 class ValidationResult:
     """Result of manifest validation."""
     
@@ -186,7 +194,14 @@ class ManifestValidator:
     Validates inquiry manifests using Pydantic models.
     Ensures structural correctness, type safety, and semantic constraints.
     """
-    
+
+    _CACHE_MAX_ENTRIES = 128
+
+    def __init__(self):
+        # Bounded LRU of validation results keyed by content hash, so
+        # revalidating an unchanged manifest is a dictionary lookup.
+        self._result_cache: "OrderedDict[str, ValidationResult]" = OrderedDict()
+
     async def validate(self, manifest: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> ValidationResult:
         """
         Validate a parsed manifest against the schema.
@@ -203,18 +218,32 @@ class ManifestValidator:
         try:
             # Extract the manifest section if it's wrapped
             manifest_data = manifest.get('manifest', manifest)
-            
-            # Validate using Pydantic model
-            validated_manifest = InquiryManifest(**manifest_data)
+
+            cache_key = hashlib.blake2b(
+                json.dumps(manifest_data, sort_keys=True, default=str).encode(),
+                digest_size=16
+            ).hexdigest()
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                return cached
+
+            # Validate using the precompiled adapter
+            validated_manifest = _MANIFEST_ADAPTER.validate_python(manifest_data)
             
             # Additional semantic validations
             errors.extend(self._validate_instrument_references(validated_manifest))
             errors.extend(self._validate_protocol_consistency(validated_manifest))
             
             if errors:
-                return ValidationResult(is_valid=False, errors=errors)
-            
-            return ValidationResult(is_valid=True, errors=[])
+                result = ValidationResult(is_valid=False, errors=errors)
+            else:
+                result = ValidationResult(is_valid=True, errors=[])
+
+            self._result_cache[cache_key] = result
+            if len(self._result_cache) > self._CACHE_MAX_ENTRIES:
+                self._result_cache.popitem(last=False)
+            return result
             
         except Exception as e:
             # Convert Pydantic validation errors to readable messages
@@ -238,11 +267,11 @@ class ManifestValidator:
     def _validate_instrument_references(self, manifest: InquiryManifest) -> List[str]:
         """Validate that instrument IDs are unique."""
         errors = []
-        instrument_ids = [inst.id for inst in manifest.instruments]
-        
-        if len(instrument_ids) != len(set(instrument_ids)):
-            duplicates = [id for id in instrument_ids if instrument_ids.count(id) > 1]
-            errors.append(f"Duplicate instrument IDs found: {set(duplicates)}")
+        counts = Counter(inst.id for inst in manifest.instruments)
+        duplicates = {id for id, count in counts.items() if count > 1}
+
+        if duplicates:
+            errors.append(f"Duplicate instrument IDs found: {duplicates}")
         
         return errors
     
@@ -20,6 +20,13 @@ import secrets
 import importlib
 from pathlib import Path
 
+try:
+    # libyaml-backed parser; roughly an order of magnitude faster than the
+    # pure-Python fallback on nontrivial manifests
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
 from ..manifest_system.parser import ManifestParser
 from ..manifest_system.validator import ManifestValidator
 from ..manifest_system.compiler import ExecutionPlanCompiler
@@ -92,6 +99,10 @@ class AssayConductor:
         self._execution_semaphore = asyncio.Semaphore(
             config.get('max_concurrent_executions', 10)
         )
+
+        # Parsed-manifest cache keyed by path -> (mtime, parsed dict), so
+        # repeat executions of the same manifest skip file IO and YAML parsing
+        self._manifest_cache: Dict[str, Any] = {}
     
     async def orchestrate(self, manifest_path: str, **overrides) -> Dict[str, Any]:
         """
@@ -164,14 +175,30 @@ class AssayConductor:
                                          context: ExecutionContext) -> Dict[str, Any]:
         """Load and validate manifest with schema validation."""
         logger.info(f"Loading manifest from {path}")
-        
+
         try:
+            # Serve repeat loads from cache while the file is unchanged
+            try:
+                mtime = Path(path).stat().st_mtime
+            except OSError:
+                mtime = None
+
+            cached = self._manifest_cache.get(path)
+            if cached is not None and mtime is not None and cached[0] == mtime:
+                return cached[1]
+
             # Load manifest file
             async with aiofiles.open(path, 'r') as f:
                 content = await f.read()
-            
-            # Parse YAML
-            raw_manifest = yaml.safe_load(content)
+
+            # Parse YAML off the event loop: safe_load is CPU-bound and
+            # would otherwise stall concurrent executions for large manifests
+            raw_manifest = await asyncio.to_thread(
+                yaml.load, content, _YamlSafeLoader
+            )
+
+            if mtime is not None:
+                self._manifest_cache[path] = (mtime, raw_manifest)
             
             # Apply overrides
             if overrides:
@@ -213,6 +240,15 @@ class AssayConductor:
                 logger.error(f"Preflight check '{check_name}' failed: {e}")
                 raise
     
+    # Preflight check dispatch: check name -> handler method name.
+    # None marks checks that are recognized but not implemented yet;
+    # register new checks here rather than extending an if/elif chain.
+    _PREFLIGHT_CHECKS: Dict[str, Optional[str]] = {
+        "instrument_availability": "_check_instrument_availability",
+        "substrate_accessibility": None,  # _check_substrate_accessibility
+        "rate_limit_capacity": None,      # _check_rate_limit_capacity
+    }
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10)
@@ -221,15 +257,15 @@ class AssayConductor:
                                       manifest: Dict[str, Any],
                                       context: ExecutionContext):
         """Execute a single preflight check with retry logic."""
-        
-        if check_name == "instrument_availability":
-            await self._check_instrument_availability(manifest, context)
-        elif check_name == "substrate_accessibility":
-            pass # await self._check_substrate_accessibility(manifest, context)
-        elif check_name == "rate_limit_capacity":
-            pass # await self._check_rate_limit_capacity(manifest, context)
-        else:
+
+        try:
+            handler_name = self._PREFLIGHT_CHECKS[check_name]
+        except KeyError:
             logger.warning(f"Unknown preflight check: {check_name}")
+            return
+
+        if handler_name is not None:
+            await getattr(self, handler_name)(manifest, context)
     
     async def _check_instrument_availability(self, manifest: Dict[str, Any],
                                             context: ExecutionContext):
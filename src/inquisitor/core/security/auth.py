@@ -8,6 +8,7 @@ Implements Basic Authentication and API Key validation.
 from fastapi import HTTPException, Security, status
 from fastapi.security import APIKeyHeader
 from typing import Optional
+import functools
 import os
 from dotenv import load_dotenv
 
@@ -16,11 +17,17 @@ load_dotenv()
 API_KEY_NAME = "X-Inquisitor-Key"
 api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=False)
 
+@functools.lru_cache(maxsize=1)
+def _expected_api_key() -> Optional[str]:
+    """Resolve the configured key once instead of per request."""
+    return os.getenv("INQUISITOR_API_KEY")
+
+
 def get_api_key(api_key_header: str = Security(api_key_header)):
     """
     Validate API Key from header.
     """
-    expected_key = os.getenv("INQUISITOR_API_KEY")
+    expected_key = _expected_api_key()
     
     if not expected_key:
         # If no key configured, warn but allow (or fail secure?)
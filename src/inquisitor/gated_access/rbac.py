@@ -20,7 +20,7 @@ class InquiryGating:
     def authorize(self, tenant_id: str, manifest_type: str) -> bool:
         allowed = manifest_type in self.policies.get(tenant_id, set())
         if not allowed:
-            logging.warning(f"Unauthorized access attempt: {tenant_id} tried {manifest_type}")
+            logging.warning("Unauthorized access attempt: %s tried %s", tenant_id, manifest_type)
         return allowed
 
 class QuantumStateSimulation:
@@ -39,5 +39,5 @@ class QuantumStateSimulation:
         # Simplified: Select highest probability state
         if not probabilities: return "UNKNOWN"
         winner = max(probabilities, key=probabilities.get)
-        logging.info(f"State collapsed to: {winner} (p={probabilities[winner]})")
+        logging.info("State collapsed to: %s (p=%s)", winner, probabilities[winner])
         return winner
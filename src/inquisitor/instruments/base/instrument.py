@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional, List, Type, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
+import time
 from datetime import datetime
 from pathlib import Path
 import json
@@ -293,6 +294,9 @@ class AbstractInstrument(ABC):
         """
         execution_id = context.get('execution_id', 'unknown')
         start_time = datetime.now()
+        # Durations come from the monotonic clock: it is immune to wall-clock
+        # steps and avoids a second datetime construction per measurement
+        start_monotonic = time.monotonic()
         
         # Check if instrument is ready
         if self._state != InstrumentState.READY:
@@ -335,7 +339,7 @@ class AbstractInstrument(ABC):
                 )
                 
                 # Calculate metrics
-                execution_time = (datetime.now() - start_time).total_seconds()
+                execution_time = time.monotonic() - start_monotonic
                 metrics = await self._calculate_execution_metrics(
                     processed_data, execution_time, execution_context
                 )
@@ -358,7 +362,7 @@ class AbstractInstrument(ABC):
                 
             except Exception as e:
                 # Handle execution failure
-                execution_time = (datetime.now() - start_time).total_seconds()
+                execution_time = time.monotonic() - start_monotonic
                 
                 error_result = ExecutionResult(
                     success=False,
@@ -17,9 +17,9 @@ class SubstrateSandboxing:
         Simulates spawning a containerized probe.
         In a real portfolio piece, this would use the Docker or Kubernetes API.
         """
-        logging.info(f"Spawning sandboxed substrate for: {instrument_cmd}")
+        logging.info("Spawning sandboxed substrate for: %s", instrument_cmd)
         # Simulation: In reality, we'd run 'docker run --rm ...'
         return "SUCCESS: Container isolated execution path established."
 
     def cleanup_substrate(self, container_id: str):
-        logging.info(f"Cleaning up substrate: {container_id}")
+        logging.info("Cleaning up substrate: %s", container_id)
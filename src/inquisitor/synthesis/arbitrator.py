@@ -19,7 +19,21 @@ class HermeneuticSynthesizer:
         # Example Logic: Weighted average based on instrument confidence scores
         if not instrument_outputs:
             return {"status": "INCONCLUSIVE", "message": "No data from instruments."}
-            
+
+        # Fast path: with a single instrument there is nothing to arbitrate,
+        # so skip the weighted-average passes entirely.
+        if len(instrument_outputs) == 1:
+            sole = instrument_outputs[0]
+            confidence = sole.get('confidence_score', 0)
+            if confidence == 0:
+                return {"status": "INCONCLUSIVE", "message": "Zero confidence readings."}
+            value = float(sole.get('raw_data', 0))
+            return {
+                "status": "VERIFIED" if value > 0 else "INVALID",
+                "synthesized_value": value,
+                "confidence": confidence
+            }
+
         total_confidence = sum(o.get('confidence_score', 0) for o in instrument_outputs)
         if total_confidence == 0:
             return {"status": "INCONCLUSIVE", "message": "Zero confidence readings."}
@@ -27,7 +41,7 @@ class HermeneuticSynthesizer:
         # Simplified Weighted Result (e.g., VWAP or Consensus Price)
         weighted_price = sum(float(o.get('raw_data', 0)) * o.get('confidence_score', 0) for o in instrument_outputs) / total_confidence
         
-        logging.info(f"Synthesized price across {len(instrument_outputs)} instruments: ${weighted_price:.2f}")
+        logging.info("Synthesized price across %d instruments: $%.2f", len(instrument_outputs), weighted_price)
         
         # Financial Integrity Check (e.g., within expected spread)
         status = "VERIFIED" if weighted_price > 0 else "INVALID"
@@ -54,6 +68,6 @@ class ApophaticVerifier:
         """Verify if a finding is physically possible in the real world."""
         for rule in self.exclusion_rules:
             if rule(value):
-                logging.warning(f"Reading {value} rigorously excluded by apophatic rules.")
+                logging.warning("Reading %s rigorously excluded by apophatic rules.", value)
                 return False
         return True